@@ -4,14 +4,14 @@ import argparse
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import csv
+from typing import Dict, List, Optional, Set, Tuple
 
 from dotenv import load_dotenv
 from .config import Config, FileMapping, SyncMode, ConfigurationError
-from .storage_client import StorageClient
+from .storage_client import BatchLoadError, StorageClient, StorageError
 from .daemon import Daemon
 from .sync import sync_file
+from .utils import analyze_csv
 
 def _handle_interrupt(message: str = "Operation cancelled by user") -> None:
     """Handle keyboard interrupt gracefully.
@@ -326,25 +326,25 @@ class CLI:
             path = self._resolve_file_path(file_path)
             print(f"\nAnalyzing file: {path}")
             
-            with open(path, 'r') as f:
-                # Try to read first few lines to analyze
-                reader = csv.reader(f)
-                headers = next(reader)  # Get headers
-                
-                # Try to read first row to check for unique identifiers
-                try:
-                    first_row = next(reader)
-                    # Look for columns that might be IDs (contain 'id' or are unique)
-                    potential_keys = [
-                        header for header in headers
-                        if 'id' in header.lower() or 
-                        'key' in header.lower() or
-                        'code' in header.lower()
-                    ]
-                    return headers, potential_keys
-                except StopIteration:
-                    # File only has headers
-                    return headers, None
+            # Detect dialect and read header + first row in a single read
+            csv_dialect = self.config.get('csv_dialect', {})
+            _, headers, first_row = analyze_csv(
+                path,
+                delimiter=csv_dialect.get('delimiter'),
+                quotechar=csv_dialect.get('quotechar') or '"'
+            )
+            if not headers or first_row is None:
+                # Empty file or file only has headers
+                return headers, None
+            
+            # Look for columns that might be IDs (contain 'id' or are unique)
+            potential_keys = [
+                header for header in headers
+                if 'id' in header.lower() or 
+                'key' in header.lower() or
+                'code' in header.lower()
+            ]
+            return headers, potential_keys
                 
         except Exception as e:
             print(f"\nWarning: Could not analyze file {file_path}: {e}")
@@ -630,9 +630,9 @@ class CLI:
         else:
             print("\nSyncing all mappings:")
             print("-" * 80)
-            for mapping in mappings:
-                if mapping.get('enabled', True):
-                    self._sync_single_mapping(mapping)
+            self._sync_all_mappings(
+                [m for m in mappings if m.get('enabled', True)]
+            )
 
     def _sync_single_mapping(self, mapping: Dict) -> None:
         """Sync a single mapping.
@@ -646,6 +646,73 @@ class CLI:
         except Exception as e:
             print(f"Error syncing {mapping['file_path']}: {e}")
 
+    def _sync_all_mappings(self, mappings: List[Dict]) -> None:
+        """Sync several mappings, loading existing tables in one batch.
+        
+        Mappings whose file is missing or whose table does not exist yet go
+        through sync_file one by one. Loads into existing tables are
+        submitted together so their import jobs run concurrently.
+        
+        Args:
+            mappings: Enabled mapping configurations
+        """
+        try:
+            client = self._get_storage_client()
+        except Exception as e:
+            print(f"Error syncing mappings: {e}")
+            return
+        
+        # List each bucket's tables once instead of once per mapping
+        tables_by_bucket: Dict[str, Set[str]] = {}
+        batch = []
+        for mapping in mappings:
+            bucket_id = mapping['bucket_id']
+            if bucket_id not in tables_by_bucket:
+                try:
+                    tables_by_bucket[bucket_id] = {
+                        t['id'] for t in client.list_tables(bucket_id)
+                    }
+                except StorageError:
+                    tables_by_bucket[bucket_id] = set()
+            
+            if (Path(mapping['file_path']).exists()
+                    and f"{bucket_id}.{mapping['table_id']}" in tables_by_bucket[bucket_id]):
+                batch.append(mapping)
+            else:
+                self._sync_single_mapping(mapping)
+        
+        if not batch:
+            return
+        
+        errors: Dict[str, str] = {}
+        try:
+            client.load_tables([
+                (
+                    mapping['bucket_id'],
+                    mapping['table_id'],
+                    mapping['file_path'],
+                    mapping['sync_mode'] == 'incremental'
+                )
+                for mapping in batch
+            ])
+        except BatchLoadError as e:
+            errors = e.errors
+        except StorageError as e:
+            errors = {
+                f"{mapping['bucket_id']}.{mapping['table_id']}": str(e)
+                for mapping in batch
+            }
+        
+        # Report each table the way sync_file does
+        for mapping in batch:
+            full_id = f"{mapping['bucket_id']}.{mapping['table_id']}"
+            print(f"\nSyncing {mapping['file_path']} -> {full_id}")
+            print(f"Mode: {mapping['sync_mode']}")
+            if full_id in errors:
+                print(f"Error during sync: {errors[full_id]}")
+            else:
+                print("Sync completed successfully")
+
     def start_daemon(self) -> None:
         """Start the daemon process."""
         daemon = Daemon(self.config_file)
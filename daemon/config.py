@@ -140,7 +140,14 @@ class Config:
             'max_retries': int(default_settings.get('max_retries', 3)),
             'initial_retry_delay': float(default_settings.get('initial_retry_delay', 1.0)),
             'max_retry_delay': float(default_settings.get('max_retry_delay', 30.0)),
-            'retry_backoff': float(default_settings.get('retry_backoff', 2.0))
+            'retry_backoff': float(default_settings.get('retry_backoff', 2.0)),
+            'debounce_seconds': float(default_settings.get('debounce_seconds', 0.5)),
+            'ignored_dirs': default_settings.get('ignored_dirs', []),
+            'max_workers': (
+                int(v) if (v := default_settings.get('max_workers')) is not None
+                else None  # None = CPU count
+            ),
+            'force_polling': bool(default_settings.get('force_polling', False))
         }
 
     def _get_required(self, key: str) -> str:
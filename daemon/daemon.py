@@ -1,15 +1,15 @@
 """Daemon process that monitors files and syncs them to Keboola Storage."""
 
 import logging
+import os
 import time
-from pathlib import Path
 from typing import Dict, List, Optional
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent
 
 from .config import FileMapping, ConfigurationError
 from .storage_client import StorageClient
 from .sync import sync_file
+from .watcher import create_observer
 
 class FileHandler(FileSystemEventHandler):
     """Handle file system events for monitored files."""
@@ -34,6 +34,14 @@ class FileHandler(FileSystemEventHandler):
         # Track last sync times to prevent duplicate events
         self.last_syncs = {}
         
+        # Index enabled mappings by normalized path so events are matched
+        # with one dict lookup instead of a Path comparison per mapping
+        self._mappings_by_path: Dict[str, List[Dict]] = {}
+        for mapping in mappings:
+            if mapping.get('enabled', True):
+                key = os.path.normpath(mapping['file_path'])
+                self._mappings_by_path.setdefault(key, []).append(mapping)
+        
     def on_modified(self, event):
         """Handle file modification events.
         
@@ -46,12 +54,8 @@ class FileHandler(FileSystemEventHandler):
         file_path = event.src_path
         
         # Find matching mappings
-        for mapping in self.mappings:
-            if not mapping.get('enabled', True):
-                continue
-                
-            if Path(mapping['file_path']) == Path(file_path):
-                self._handle_file_change(mapping, file_path)
+        for mapping in self._mappings_by_path.get(os.path.normpath(file_path), ()):
+            self._handle_file_change(mapping, file_path)
                 
     def _handle_file_change(self, mapping: Dict, file_path: str) -> None:
         """Handle a file change event.
@@ -138,7 +142,11 @@ class Daemon:
                 logger=self.logger
             )
             
-            self.observer = Observer()
+            self.observer = create_observer(
+                watched_dir,
+                self.config.get('default_settings', {}).get('force_polling', False),
+                self.logger
+            )
             self.observer.schedule(handler, watched_dir, recursive=False)
             self.observer.start()
             
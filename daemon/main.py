@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Optional
 
 from .config import Config, ConfigurationError
-from .utils import setup_logging
+from .utils import setup_logging, stop_logging
 from .storage_client import StorageClient, StorageError
 from .watcher import DirectoryWatcher
 
@@ -112,7 +112,11 @@ class DaemonContext:
                 path=self.config['watched_directory'],
                 storage_client=self.storage,
                 logger=self.logger,
-                compression_threshold_mb=self.config.get('compression_threshold_mb', 50)
+                compression_threshold_mb=self.config.get('compression_threshold_mb', 50),
+                debounce_seconds=self.config.get('debounce_seconds', 0.5),
+                ignored_dirs=self.config.get('ignored_dirs'),
+                max_workers=self.config.get('max_workers'),
+                force_polling=self.config.get('force_polling', False)
             )
             self.watcher.start()
             
@@ -154,6 +158,7 @@ class DaemonContext:
             
             if self.logger:
                 self.logger.info('Daemon stopped')
+                stop_logging(self.logger)
                 
         except Exception as e:
             if self.logger:
@@ -7,7 +7,7 @@ official Python SDK.
 import csv
 import logging
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 from kbcstorage.client import Client
 from kbcstorage.tables import Tables
 
@@ -17,6 +17,23 @@ class StorageError(Exception):
     """Base exception for storage operations."""
     pass
 
+class BatchLoadError(StorageError):
+    """Raised when some loads of a batch fail.
+    
+    Attributes:
+        errors: Error message for each failed table, keyed by table ID
+        loaded: IDs of the tables that were loaded
+    """
+    
+    def __init__(self, errors: Dict[str, str], loaded: List[str]):
+        self.errors = errors
+        self.loaded = loaded
+        details = '; '.join(f"{table}: {error}" for table, error in errors.items())
+        super().__init__(
+            f"Failed to load table data: {details} "
+            f"(loaded: {', '.join(loaded) or 'none'})"
+        )
+
 class StorageClient:
     """Wrapper for Keboola Storage API client."""
     
@@ -67,6 +84,11 @@ class StorageClient:
             self._buckets_cache = None
             raise StorageError(f"Failed to connect to Keboola Storage API: {e}")
 
+    @staticmethod
+    def _full_table_id(bucket_id: str, table_id: str) -> str:
+        """Build the fully qualified table ID (``bucket.table``)."""
+        return f"{bucket_id}.{table_id}"
+
     def _ensure_connected(self) -> None:
         """Ensure we have a valid connection."""
         if not self._client:
@@ -128,10 +150,8 @@ class StorageClient:
         """Check if a table exists in the bucket."""
         try:
             tables = self._client.tables.list()
-            return any(
-                t['id'] == f"{bucket_id}.{table_id}"
-                for t in tables
-            )
+            full_id = self._full_table_id(bucket_id, table_id)
+            return any(t['id'] == full_id for t in tables)
         except Exception as e:
             raise StorageError(f"Failed to check table existence: {e}")
     
@@ -181,7 +201,7 @@ class StorageClient:
             
             # Load data - pass the file path string directly
             tables.load(
-                table_id=f"{bucket_id}.{table_id}",
+                table_id=self._full_table_id(bucket_id, table_id),
                 file_path=str(file_path),  # Convert Path to string
                 is_incremental=is_incremental
             )
@@ -205,7 +225,9 @@ class StorageClient:
     def get_table(self, bucket_id: str, table_id: str) -> Dict:
         """Get table details."""
         try:
-            return self._client.tables.detail(f"{bucket_id}.{table_id}")
+            return self._client.tables.detail(
+                self._full_table_id(bucket_id, table_id)
+            )
         except Exception as e:
             raise StorageError(f"Failed to get table details: {e}")
 
@@ -303,13 +325,67 @@ class StorageClient:
         """
         try:
             self._client.tables.load(
-                table_id=f"{bucket_id}.{table_id}",
+                table_id=self._full_table_id(bucket_id, table_id),
                 file_path=str(file_path),
                 is_incremental=is_incremental
             )
         except Exception as e:
             raise StorageError(f"Failed to load table data: {e}")
 
+    def load_tables(
+        self,
+        loads: List[Tuple[str, str, Union[str, Path], bool]]
+    ) -> None:
+        """Load data into several tables at once.
+        
+        All files are uploaded and their import jobs started before waiting
+        on any of them, so the jobs run concurrently instead of each load
+        polling its job to completion in turn.
+        
+        Args:
+            loads: List of (bucket_id, table_id, file_path, is_incremental)
+            
+        Raises:
+            BatchLoadError: If any upload or import job fails
+        """
+        jobs = []
+        errors: Dict[str, str] = {}
+        for bucket_id, table_id, file_path, is_incremental in loads:
+            full_id = self._full_table_id(bucket_id, table_id)
+            try:
+                file_id = self._client.files.upload_file(
+                    file_path=str(file_path),
+                    tags=['file-import'],
+                    do_notify=False,
+                    is_public=False
+                )
+                job = self._client.tables.load_raw(
+                    table_id=full_id,
+                    data_file_id=file_id,
+                    is_incremental=is_incremental
+                )
+            except Exception as e:
+                errors[full_id] = str(e)
+                continue
+            jobs.append((full_id, job['id']))
+        
+        # Wait on every started job, even after a failure, so none is left
+        # running unreported
+        loaded = []
+        for full_id, job_id in jobs:
+            try:
+                job = self._client.jobs.block_until_completed(job_id)
+            except Exception as e:
+                errors[full_id] = str(e)
+                continue
+            if job['status'] == 'error':
+                errors[full_id] = job['error']['message']
+            else:
+                loaded.append(full_id)
+        
+        if errors:
+            raise BatchLoadError(errors, loaded)
+
     def table_exists(self, bucket_id: str, table_id: str) -> bool:
         """Check if a table exists.
         
@@ -322,6 +398,7 @@ class StorageClient:
         """
         try:
             tables = self.list_tables(bucket_id)
-            return any(t['id'] == f"{bucket_id}.{table_id}" for t in tables)
+            full_id = self._full_table_id(bucket_id, table_id)
+            return any(t['id'] == full_id for t in tables)
         except Exception:
             return False
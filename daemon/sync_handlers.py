@@ -1,16 +1,17 @@
 """Sync mode handlers for different file types and sync strategies."""
 
 import os
-import csv
 import gzip
+import hashlib
 import json
 import logging
 import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .storage_client import StorageClient, StorageError
 from .utils import (
@@ -20,6 +21,12 @@ from .utils import (
     get_compressed_reader
 )
 
+# Write buffer size for staged upload files
+UPLOAD_BUFFER_SIZE = 1024 * 1024  # 1MB
+
+# Bytes read per step when looking for the last complete line
+NEWLINE_SCAN_SIZE = 64 * 1024  # 64KB
+
 class SyncHandler(ABC):
     """Base class for sync mode handlers."""
     
@@ -41,17 +48,90 @@ class SyncHandler(ABC):
         self.compression_threshold = compression_threshold_mb * 1024 * 1024
         self._temp_files: Set[str] = set()
 
+    def _remove_temp_file(self, temp_file: str) -> None:
+        """Remove a single tracked temporary file."""
+        try:
+            os.remove(temp_file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(
+                f'Failed to remove temporary file: {temp_file}',
+                extra={'error': str(e)}
+            )
+            return
+        self._temp_files.discard(temp_file)
+
     def cleanup(self):
         """Clean up any temporary files."""
-        for temp_file in self._temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except Exception as e:
-                self.logger.warning(
-                    f'Failed to remove temporary file: {temp_file}',
-                    extra={'error': str(e)}
+        for temp_file in list(self._temp_files):
+            self._remove_temp_file(temp_file)
+
+    def _prepare_upload(self, file_path: Path) -> Path:
+        """Get the file to upload, gzipped if it exceeds the threshold.
+        
+        Compression uses the fastest level; Storage imports ``.gz`` files
+        directly, so only the compressed bytes go over the network.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Returns:
+            Path to the compressed temporary file, or file_path itself
+        """
+        compressed = compress_file(
+            file_path,
+            self.compression_threshold,
+            self.logger,
+            compresslevel=1
+        )
+        if compressed is None:
+            return file_path
+        self._temp_files.add(str(compressed))
+        return compressed
+
+    def _upload(
+        self,
+        file_path: Path,
+        bucket_id: str,
+        table_id: str,
+        options: Dict,
+        initial_load: bool,
+        is_incremental: bool = False
+    ) -> None:
+        """Create a table from a file, or load the file into the table.
+        
+        Args:
+            file_path: Path to the CSV file
+            bucket_id: Bucket ID
+            table_id: Table ID
+            options: Mapping options
+            initial_load: Whether to create the table
+            is_incremental: Whether to append to the table when loading
+        """
+        upload_path = self._prepare_upload(file_path)
+        try:
+            if initial_load:
+                self.storage.create_table(
+                    bucket_id=bucket_id,
+                    table_id=table_id,
+                    file_path=upload_path,
+                    primary_key=options.get('primary_key', [])
+                )
+            else:
+                self.storage.load_table(
+                    bucket_id=bucket_id,
+                    table_id=table_id,
+                    file_path=upload_path,
+                    is_incremental=is_incremental
                 )
+        finally:
+            if upload_path != file_path:
+                self._remove_temp_file(str(upload_path))
+
+    def _has_processed(self, file_path: Path) -> bool:
+        """Check whether this handler has already loaded a file."""
+        return False
 
     @abstractmethod
     def handle_created(
@@ -75,9 +155,50 @@ class SyncHandler(ABC):
         """Handle file modification event."""
         pass
 
+    def handle_replaced(
+        self,
+        file_path: Path,
+        bucket_id: str,
+        table_id: str,
+        options: Dict
+    ) -> None:
+        """Handle a file renamed into place.
+        
+        Atomic writers often produce the first version of a file this way,
+        so a file this handler has never loaded creates its table, unless
+        the table already exists (e.g. loaded before a daemon restart).
+        """
+        if (self._has_processed(file_path)
+                or self.storage.table_exists(bucket_id, table_id)):
+            self.handle_modified(file_path, bucket_id, table_id, options)
+        else:
+            self.handle_created(file_path, bucket_id, table_id, options)
+
 class FullLoadHandler(SyncHandler):
     """Handler for full load sync mode."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_upload_sig: Dict[str, Tuple[int, int]] = {}
+        self._last_upload_digest: Dict[str, bytes] = {}
+
+    def _file_signature(self, file_path: Path) -> Tuple[int, int]:
+        """Get a cheap content fingerprint (size, mtime) for a file."""
+        stat = file_path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def _file_digest(self, file_path: Path) -> bytes:
+        """Hash the file contents in 1 MiB chunks."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.digest()
+
+    def _has_processed(self, file_path: Path) -> bool:
+        """Check whether this handler has already loaded a file."""
+        return str(file_path) in self._last_upload_sig
+
     def handle_created(
         self,
         file_path: Path,
@@ -99,12 +220,13 @@ class FullLoadHandler(SyncHandler):
                 }
             )
             
-            self.storage.create_table(
-                bucket_id=bucket_id,
-                table_id=table_id,
-                file_path=file_path,
-                primary_key=options.get('primary_key', [])
+            sig = self._file_signature(file_path)
+            digest = self._file_digest(file_path)
+            self._upload(
+                file_path, bucket_id, table_id, options, initial_load=True
             )
+            self._last_upload_sig[str(file_path)] = sig
+            self._last_upload_digest[str(file_path)] = digest
         except StorageError as e:
             self.logger.error(
                 'Failed to create table',
@@ -126,9 +248,31 @@ class FullLoadHandler(SyncHandler):
     ) -> None:
         """Handle file modification with full load.
         
-        Replaces the entire table contents with the new file.
+        Replaces the entire table contents with the new file. Skips the
+        upload if the file is unchanged since the last successful load,
+        by size and mtime or, failing that, by content hash.
         """
         try:
+            file_key = str(file_path)
+            sig = self._file_signature(file_path)
+            if self._last_upload_sig.get(file_key) == sig:
+                self.logger.debug(
+                    'File unchanged since last upload, skipping',
+                    extra={'path': file_key}
+                )
+                return
+            
+            # Touches and atomic saves of identical content only change the
+            # mtime; hashing is much cheaper than compressing and uploading
+            digest = self._file_digest(file_path)
+            if digest == self._last_upload_digest.get(file_key):
+                self._last_upload_sig[file_key] = sig
+                self.logger.debug(
+                    'File content unchanged since last upload, skipping',
+                    extra={'path': file_key}
+                )
+                return
+            
             self.logger.info(
                 'Replacing table data with full load',
                 extra={
@@ -138,12 +282,11 @@ class FullLoadHandler(SyncHandler):
                 }
             )
             
-            self.storage.load_table(
-                bucket_id=bucket_id,
-                table_id=table_id,
-                file_path=file_path,
-                is_incremental=False
+            self._upload(
+                file_path, bucket_id, table_id, options, initial_load=False
             )
+            self._last_upload_sig[file_key] = sig
+            self._last_upload_digest[file_key] = digest
         except StorageError as e:
             self.logger.error(
                 'Failed to replace table data',
@@ -161,35 +304,82 @@ class IncrementalHandler(SyncHandler):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._processed_lines: Dict[str, int] = {}
-
-    def _count_lines(self, file_path: Path) -> int:
-        """Count number of lines in a file."""
-        with open(file_path, 'r') as f:
-            return sum(1 for _ in f)
+        self._processed_offsets: Dict[str, int] = {}
 
-    def _read_new_lines(self, file_path: Path) -> Tuple[List[str], int]:
-        """Read only new lines from the file.
+    def _complete_lines_end(self, f: BinaryIO, start: int) -> int:
+        """Find where the complete lines appended after an offset end.
         
+        Scans backwards from the end of the file for the last newline, so
+        only the tail is read. A trailing line without a newline is still
+        being written and is left for the next event.
+        
+        Args:
+            f: File opened in binary mode
+            start: Offset processed so far
+            
         Returns:
-            Tuple of (new lines list, total line count)
+            Offset just past the last newline, or start if there is none
         """
-        total_lines = self._count_lines(file_path)
-        start_line = self._processed_lines.get(str(file_path), 0)
+        pos = f.seek(0, os.SEEK_END)
+        while pos > start:
+            chunk_start = max(start, pos - NEWLINE_SCAN_SIZE)
+            f.seek(chunk_start)
+            index = f.read(pos - chunk_start).rfind(b'\n')
+            if index >= 0:
+                return chunk_start + index + 1
+            pos = chunk_start
+        return start
+
+    def _stage_lines(self, src: BinaryIO, start: int, end: int) -> str:
+        """Copy a range of complete lines to a temporary upload file.
+        
+        The bytes are copied verbatim in bounded chunks and never decoded;
+        ranges after the start of the file are prefixed with its header.
         
-        if start_line >= total_lines:
-            return [], total_lines
+        Args:
+            src: File opened in binary mode
+            start: Offset of the first line to copy
+            end: Offset just past the last line to copy
             
-        new_lines = []
-        with open(file_path, 'r') as f:
-            # Skip already processed lines
-            for _ in range(start_line):
-                next(f)
-            # Read new lines
-            for line in f:
-                new_lines.append(line)
+        Returns:
+            Path to the temporary file
+        """
+        src.seek(0)
+        header = src.readline() if start else b''
+        src.seek(start)
+        with tempfile.NamedTemporaryFile(
+            mode='wb',
+            suffix='.csv',
+            delete=False,
+            buffering=UPLOAD_BUFFER_SIZE
+        ) as temp_file:
+            self._temp_files.add(temp_file.name)
+            temp_file.write(header)
+            remaining = end - start
+            while remaining:
+                chunk = src.read(min(remaining, UPLOAD_BUFFER_SIZE))
+                if not chunk:
+                    break
+                temp_file.write(chunk)
+                remaining -= len(chunk)
+        return temp_file.name
+
+    def handle_replaced(
+        self,
+        file_path: Path,
+        bucket_id: str,
+        table_id: str,
+        options: Dict
+    ) -> None:
+        """Handle a file renamed into place.
         
-        return new_lines, total_lines
+        The offset processed in the old file means nothing in its
+        replacement, so the new file is appended from the start.
+        """
+        if self._processed_offsets.pop(str(file_path), None) is not None:
+            self.handle_modified(file_path, bucket_id, table_id, options)
+        else:
+            super().handle_replaced(file_path, bucket_id, table_id, options)
 
     def handle_created(
         self,
@@ -200,8 +390,11 @@ class IncrementalHandler(SyncHandler):
     ) -> None:
         """Handle file creation with incremental load.
         
-        Creates a new table with initial data.
+        Creates a new table with initial data. A trailing line without a
+        newline is still being written and is left for the next event.
         """
+        file_key = str(file_path)
+        temp_path = None
         try:
             self.logger.info(
                 'Creating table with incremental load',
@@ -212,15 +405,25 @@ class IncrementalHandler(SyncHandler):
                 }
             )
             
-            self.storage.create_table(
-                bucket_id=bucket_id,
-                table_id=table_id,
-                file_path=file_path,
-                primary_key=options.get('primary_key', [])
+            # Taken before the upload, so data appended meanwhile is picked
+            # up by the next modification
+            with open(file_path, 'rb') as src:
+                size = src.seek(0, os.SEEK_END)
+                end = self._complete_lines_end(src, 0)
+                # A file without any newline is uploaded whole (it is
+                # at most a header) and appended from the start next time
+                if 0 < end < size:
+                    temp_path = self._stage_lines(src, 0, end)
+            self._upload(
+                Path(temp_path) if temp_path else file_path,
+                bucket_id,
+                table_id,
+                options,
+                initial_load=True
             )
             
-            # Record processed lines
-            self._processed_lines[str(file_path)] = self._count_lines(file_path)
+            # Record processed bytes
+            self._processed_offsets[file_key] = end
             
         except StorageError as e:
             self.logger.error(
@@ -233,6 +436,9 @@ class IncrementalHandler(SyncHandler):
                 }
             )
             raise
+        finally:
+            if temp_path:
+                self._remove_temp_file(temp_path)
 
     def handle_modified(
         self,
@@ -245,46 +451,51 @@ class IncrementalHandler(SyncHandler):
         
         Appends only new lines to the table.
         """
+        file_key = str(file_path)
+        temp_path = None
         try:
-            new_lines, total_lines = self._read_new_lines(file_path)
-            
-            if not new_lines:
-                self.logger.debug(
-                    'No new lines to process',
-                    extra={'path': str(file_path)}
+            start = self._processed_offsets.get(file_key, 0)
+            with open(file_path, 'rb') as src:
+                if src.seek(0, os.SEEK_END) < start:
+                    # Truncated or rewritten in place; the old offset may
+                    # fall inside a row, so load the file from the start
+                    self.logger.info(
+                        'File shrank since last load, reloading from start',
+                        extra={'path': file_key}
+                    )
+                    start = 0
+                end = self._complete_lines_end(src, start)
+                if end == start:
+                    self.logger.debug(
+                        'No new lines to process',
+                        extra={'path': file_key}
+                    )
+                    return
+                
+                self.logger.info(
+                    'Appending new lines to table',
+                    extra={
+                        'path': file_key,
+                        'bucket_id': bucket_id,
+                        'table_id': table_id,
+                        'new_bytes': end - start
+                    }
                 )
-                return
-            
-            self.logger.info(
-                'Appending new lines to table',
-                extra={
-                    'path': str(file_path),
-                    'bucket_id': bucket_id,
-                    'table_id': table_id,
-                    'new_lines': len(new_lines)
-                }
-            )
-            
-            # Create temporary file with new lines
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.csv',
-                delete=False
-            ) as temp_file:
-                self._temp_files.add(temp_file.name)
-                writer = csv.writer(temp_file)
-                writer.writerows(new_lines)
+                
+                temp_path = self._stage_lines(src, start, end)
             
             # Load new lines incrementally
-            self.storage.load_table(
-                bucket_id=bucket_id,
-                table_id=table_id,
-                file_path=Path(temp_file.name),
+            self._upload(
+                Path(temp_path),
+                bucket_id,
+                table_id,
+                options,
+                initial_load=False,
                 is_incremental=True
             )
             
-            # Update processed lines count
-            self._processed_lines[str(file_path)] = total_lines
+            # Update processed offset
+            self._processed_offsets[file_key] = end
             
         except StorageError as e:
             self.logger.error(
@@ -298,7 +509,8 @@ class IncrementalHandler(SyncHandler):
             )
             raise
         finally:
-            self.cleanup()
+            if temp_path:
+                self._remove_temp_file(temp_path)
 
 class StreamingHandler(SyncHandler):
     """Handler for streaming sync mode."""
@@ -307,6 +519,18 @@ class StreamingHandler(SyncHandler):
         super().__init__(*args, **kwargs)
         self._batch_sizes: Dict[str, int] = {}
         self._current_batches: Dict[str, List[str]] = {}
+        
+        # Shared session so batches reuse pooled keep-alive connections
+        # instead of a new TCP/TLS handshake per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def cleanup(self):
+        """Clean up temporary files and close the HTTP session."""
+        super().cleanup()
+        self._session.close()
 
     def _get_batch_size(self, options: Dict) -> int:
         """Get batch size from options with default."""
@@ -321,6 +545,23 @@ class StreamingHandler(SyncHandler):
             )
         return endpoint
 
+    def handle_replaced(
+        self,
+        file_path: Path,
+        bucket_id: str,
+        table_id: str,
+        options: Dict
+    ) -> None:
+        """Handle a file renamed into place.
+        
+        Streaming creates no table, so a file not seen before just starts
+        a new stream.
+        """
+        if str(file_path) in self._batch_sizes:
+            self.handle_modified(file_path, bucket_id, table_id, options)
+        else:
+            self.handle_created(file_path, bucket_id, table_id, options)
+
     def _send_batch(
         self,
         endpoint: str,
@@ -329,10 +570,11 @@ class StreamingHandler(SyncHandler):
     ) -> None:
         """Send a batch of lines to the streaming endpoint."""
         try:
-            response = requests.post(
+            response = self._session.post(
                 endpoint,
                 data='\n'.join(batch),
-                headers={'Content-Type': 'text/plain'}
+                headers={'Content-Type': 'text/plain'},
+                timeout=(3.0, 30.0)
             )
             response.raise_for_status()
             
@@ -5,17 +5,27 @@ directory/file changes accordingly.
 """
 
 import os
+import re
 import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 import logging
 from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver, ObservedWatch
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import (
     FileSystemEventHandler,
     FileCreatedEvent,
     FileModifiedEvent,
     DirCreatedEvent,
-    FileSystemEvent
+    FileSystemEvent,
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_DELETED,
+    EVENT_TYPE_MODIFIED,
+    EVENT_TYPE_MOVED
 )
 
 from .storage_client import StorageClient, StorageError
@@ -27,6 +37,101 @@ from .sync_handlers import (
 )
 from .config import SyncMode, FileMapping
 
+# File event types that trigger processing
+_HANDLED_EVENT_TYPES = frozenset(
+    {EVENT_TYPE_CREATED, EVENT_TYPE_MODIFIED, EVENT_TYPE_MOVED}
+)
+
+# Directory event types that change which directories need watching
+_DIRECTORY_EVENT_TYPES = frozenset(
+    {EVENT_TYPE_CREATED, EVENT_TYPE_DELETED, EVENT_TYPE_MOVED}
+)
+
+# Directory names that are never watched
+IGNORED_DIRS = frozenset({'.git', 'node_modules', '__pycache__'})
+
+# Hidden files, Office lock files, editor swap files and partial downloads
+_IGNORED_PREFIXES = ('.', '~$')
+_IGNORED_SUFFIXES = ('.tmp', '.swp', '.part', '.crdownload')
+
+# Time a file's size must stay unchanged before it is considered written
+FILE_SETTLE_SECONDS = 0.05
+
+# Maximum number of files queued for or running on the worker pool
+MAX_QUEUED_EVENTS = 1024
+
+# Filesystems whose changes made on other hosts never reach inotify
+NETWORK_FILESYSTEMS = frozenset(
+    {'cifs', 'smb3', 'smbfs', 'nfs', 'nfs4', 'fuse.sshfs', '9p'}
+)
+
+# Seconds between directory scans when polling
+POLLING_INTERVAL = 5.0
+
+# Octal escapes used for whitespace in /proc/mounts mount points
+_MOUNT_ESCAPE = re.compile(r'\\([0-7]{3})')
+
+def _filesystem_type(path: str) -> Optional[str]:
+    """Get the type of the filesystem a path lives on.
+    
+    Args:
+        path: Path to look up
+        
+    Returns:
+        Filesystem type from /proc/mounts, or None where that is unavailable
+    """
+    path = os.path.realpath(path)
+    best, fs_type = '', None
+    try:
+        with open('/proc/mounts') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = _MOUNT_ESCAPE.sub(
+                    lambda m: chr(int(m.group(1), 8)), fields[1]
+                )
+                # The longest mount point containing the path wins
+                if (len(mount_point) > len(best) and (
+                        path == mount_point
+                        or path.startswith(mount_point.rstrip('/') + '/'))):
+                    best, fs_type = mount_point, fields[2]
+    except OSError:
+        return None
+    return fs_type
+
+def create_observer(
+    path: str,
+    force_polling: bool = False,
+    logger: Optional[logging.Logger] = None
+) -> BaseObserver:
+    """Create a native observer, or a polling one where events are lost.
+    
+    Native events miss changes made on other hosts of SMB and NFS shares,
+    so those are scanned every POLLING_INTERVAL seconds instead.
+    
+    Args:
+        path: Directory that will be watched
+        force_polling: Poll regardless of the filesystem type
+        logger: Optional logger instance
+        
+    Returns:
+        Observer instance
+    """
+    fs_type = None if force_polling else _filesystem_type(path)
+    if not force_polling and fs_type not in NETWORK_FILESYSTEMS:
+        return Observer()
+    
+    (logger or logging.getLogger(__name__)).info(
+        'Polling watched directory for changes',
+        extra={
+            'path': path,
+            'filesystem': fs_type,
+            'interval': POLLING_INTERVAL
+        }
+    )
+    return PollingObserver(timeout=POLLING_INTERVAL)
+
 class StorageEventHandler(FileSystemEventHandler):
     """Handles filesystem events and processes them for Keboola Storage."""
 
@@ -34,20 +139,45 @@ class StorageEventHandler(FileSystemEventHandler):
         self,
         storage_client: StorageClient,
         logger: Optional[logging.Logger] = None,
-        compression_threshold_mb: float = 50.0
+        compression_threshold_mb: float = 50.0,
+        debounce_seconds: float = 0.5,
+        max_workers: Optional[int] = None,
+        on_directory_event: Optional[Callable[[FileSystemEvent], None]] = None
     ):
         """Initialize the event handler.
         
         Args:
-            storage_client: Keboola Storage client instance
+            storage_client: Keboola Storage client instance, shared by all
+                events for the lifetime of the handler (create it once;
+                connecting per event costs a round-trip and a TLS handshake)
             logger: Optional logger instance
             compression_threshold_mb: File size threshold for compression in MB
+            debounce_seconds: Quiet period before a burst of events on a
+                file is processed
+            max_workers: Number of worker threads processing files
+                (defaults to CPU count)
+            on_directory_event: Optional callback for directory creation,
+                deletion and move events
         """
         self.storage = storage_client
+        self._on_directory_event = on_directory_event
         self.logger = logger or logging.getLogger(__name__)
         self.compression_threshold = compression_threshold_mb * 1024 * 1024
-        self._processing = set()  # Track files being processed
-        self._processing_lock = threading.Lock()  # Lock for thread safety
+        # Files being processed, mapped to the claim token of their owner
+        self._processing: Dict[str, object] = {}
+        self._debounce_seconds = debounce_seconds
+        # Pending debounce timers: path -> (timer, is_creation)
+        self._pending: Dict[str, Tuple[threading.Timer, bool]] = {}
+        # Files renamed into place that have not been handled yet
+        self._replaced: Set[str] = set()
+        self._pending_lock = threading.Lock()
+        # Files are analyzed and uploaded on a bounded pool so slow uploads
+        # never block watchdog's event thread or spawn unbounded threads
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            thread_name_prefix='storage-worker'
+        )
+        self._queue_slots = threading.BoundedSemaphore(MAX_QUEUED_EVENTS)
         
         # Initialize sync handlers
         self._handlers = {
@@ -68,31 +198,46 @@ class StorageEventHandler(FileSystemEventHandler):
             )
         }
 
-    def __del__(self):
-        """Clean up handlers on destruction."""
-        for handler in self._handlers.values():
+        # Clean up handler temp files when this handler is collected or at
+        # interpreter exit, whichever comes first
+        self._finalizer = weakref.finalize(
+            self,
+            self._cleanup_handlers,
+            list(self._handlers.values())
+        )
+
+    @staticmethod
+    def _cleanup_handlers(handlers: List[SyncHandler]) -> None:
+        """Clean up temporary files of all sync handlers."""
+        for handler in handlers:
             handler.cleanup()
 
-    def _is_file_ready(self, file_path: Path) -> bool:
+    def _is_file_ready(self, file_path: Path, size: int) -> bool:
         """Check if a file is ready for processing.
         
-        This helps avoid processing partially written files.
+        This helps avoid processing partially written files: the file is
+        considered ready if its size is unchanged after a short settle
+        time. Unlike an open-for-write probe this needs no write access,
+        so read-only files are processed too.
         
         Args:
             file_path: Path to the file
+            size: Size of the file from a previous stat
             
         Returns:
             True if file is ready, False otherwise
         """
+        time.sleep(FILE_SETTLE_SECONDS)
         try:
-            # Try to open file for reading and writing
-            with open(file_path, 'rb+') as f:
-                return True
-        except (IOError, PermissionError):
+            return os.stat(file_path).st_size == size
+        except OSError:
             return False
 
     def _add_to_processing(self, file_path: str) -> bool:
-        """Add file to processing set with thread safety.
+        """Claim a file for processing.
+        
+        dict.setdefault is atomic for str keys, so only one caller's token
+        is stored and no lock is needed.
         
         Args:
             file_path: Path to the file
@@ -100,16 +245,108 @@ class StorageEventHandler(FileSystemEventHandler):
         Returns:
             True if file was added, False if already being processed
         """
-        with self._processing_lock:
-            if file_path in self._processing:
-                return False
-            self._processing.add(file_path)
-            return True
+        token = object()
+        return self._processing.setdefault(file_path, token) is token
 
     def _remove_from_processing(self, file_path: str):
-        """Remove file from processing set with thread safety."""
-        with self._processing_lock:
-            self._processing.discard(file_path)
+        """Release a file claimed by _add_to_processing."""
+        self._processing.pop(file_path, None)
+
+    def _schedule(self, file_path: str, is_creation: bool) -> None:
+        """Schedule (or reschedule) debounced processing of a file.
+        
+        Each new event for a path restarts its timer, so a burst of events
+        results in a single run once the file has been quiet for
+        debounce_seconds. A pending creation stays a creation.
+        
+        Args:
+            file_path: Path to the file
+            is_creation: Whether this is a file creation event
+        """
+        with self._pending_lock:
+            pending = self._pending.get(file_path)
+            if pending:
+                pending[0].cancel()
+                is_creation = is_creation or pending[1]
+            
+            timer = threading.Timer(
+                self._debounce_seconds,
+                self._run_pending,
+                args=(file_path, is_creation)
+            )
+            timer.daemon = True
+            self._pending[file_path] = (timer, is_creation)
+            timer.start()
+
+    def _run_pending(self, file_path: str, is_creation: bool) -> None:
+        """Queue a file on the worker pool once its debounce timer fires."""
+        with self._pending_lock:
+            pending = self._pending.get(file_path)
+            if pending and pending[0] is threading.current_thread():
+                del self._pending[file_path]
+        
+        if not self._queue_slots.acquire(blocking=False):
+            self.logger.warning(
+                'Too many files queued for processing, dropping event',
+                extra={'path': file_path}
+            )
+            return
+        
+        try:
+            self._pool.submit(self._process_pending, file_path, is_creation)
+        except RuntimeError:
+            # Pool already shut down
+            self._queue_slots.release()
+
+    def _process_pending(self, file_path: str, is_creation: bool) -> None:
+        """Process a queued file on a worker thread."""
+        try:
+            if not self._add_to_processing(file_path):
+                # Still busy with an earlier run; try again after it settles
+                self._schedule(file_path, is_creation)
+                return
+            
+            try:
+                self._handle_event(file_path, is_creation)
+            finally:
+                self._remove_from_processing(file_path)
+        finally:
+            self._queue_slots.release()
+
+    def scan_directory(self, dir_path: str) -> None:
+        """Process files already inside a directory, on the worker pool.
+        
+        Walking a large tree takes a while, so it runs off the observer
+        thread rather than stalling event delivery.
+        
+        Args:
+            dir_path: Directory to scan recursively
+        """
+        try:
+            self._pool.submit(self._scan_directory, dir_path)
+        except RuntimeError:
+            # Pool already shut down
+            pass
+
+    def _scan_directory(self, dir_path: str) -> None:
+        """Dispatch a creation event for every file under a directory."""
+        for root, _, files in os.walk(dir_path):
+            for name in files:
+                self.dispatch(FileCreatedEvent(os.path.join(root, name)))
+
+    def cancel_pending(self) -> None:
+        """Cancel all pending debounced events."""
+        with self._pending_lock:
+            for timer, _ in self._pending.values():
+                timer.cancel()
+            self._pending.clear()
+            self._replaced.clear()
+
+    def shutdown(self) -> None:
+        """Cancel pending events, wait for running ones and clean up."""
+        self.cancel_pending()
+        self._pool.shutdown(wait=True)
+        self._finalizer()
 
     def _get_handler(self, mapping: FileMapping) -> SyncHandler:
         """Get the appropriate sync handler for a mapping.
@@ -130,27 +367,46 @@ class StorageEventHandler(FileSystemEventHandler):
 
     def _process_file_event(
         self,
-        event: FileSystemEvent,
+        file_path: Path,
         mapping: FileMapping,
         is_creation: bool = False
     ) -> None:
         """Process a file event with the appropriate handler.
         
         Args:
-            event: File system event
+            file_path: Path to the file
             mapping: File mapping configuration
             is_creation: Whether this is a file creation event
         """
-        file_path = Path(event.src_path)
+        # Files removed during the debounce window and empty files (atomic
+        # writers create them before renaming) have nothing to upload
+        try:
+            size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            return
+        if size == 0:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    'Skipping empty file',
+                    extra={'path': str(file_path)}
+                )
+            return
         
         # Wait for file to be ready
-        if not self._is_file_ready(file_path):
-            self.logger.debug(
-                'File not ready for processing, will retry on modification',
-                extra={'path': str(file_path)}
-            )
+        if not self._is_file_ready(file_path, size):
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    'File not ready for processing, will retry on modification',
+                    extra={'path': str(file_path)}
+                )
             return
         
+        # Claimed only once the file is handled, so a replacement that is
+        # not ready yet is still treated as one when it is retried
+        with self._pending_lock:
+            replaced = str(file_path) in self._replaced
+            self._replaced.discard(str(file_path))
+        
         try:
             handler = self._get_handler(mapping)
             
@@ -161,6 +417,13 @@ class StorageEventHandler(FileSystemEventHandler):
                     mapping.table_id,
                     mapping.options
                 )
+            elif replaced:
+                handler.handle_replaced(
+                    file_path,
+                    mapping.bucket_id,
+                    mapping.table_id,
+                    mapping.options
+                )
             else:
                 handler.handle_modified(
                     file_path,
@@ -175,49 +438,83 @@ class StorageEventHandler(FileSystemEventHandler):
                 extra={
                     'path': str(file_path),
                     'error': str(e),
-                    'event_type': 'created' if is_creation else 'modified'
+                    'event_type': (
+                        'created' if is_creation
+                        else 'replaced' if replaced
+                        else 'modified'
+                    )
                 }
             )
             raise
-        finally:
-            self._remove_from_processing(event.src_path)
 
-    def on_created(self, event: FileSystemEvent) -> None:
-        """Handle creation events.
+    def _handle_event(self, src_path: str, is_creation: bool) -> None:
+        """Look up the mapping for a file and process the event.
         
         Args:
-            event: File system event
+            src_path: Path to the file
+            is_creation: Whether this is a file creation event
         """
-        if event.is_directory:
-            return
-            
-        if not self._add_to_processing(event.src_path):
-            return
-            
         try:
-            file_path = Path(event.src_path)
-            mapping = self.storage.get_mapping_for_file(str(file_path))
+            mapping = self.storage.get_mapping_for_file(src_path)
             
             if not mapping or not mapping.enabled:
-                self.logger.debug(
-                    'Ignoring file with no mapping or disabled mapping',
-                    extra={'path': str(file_path)}
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        'Ignoring file with no mapping or disabled mapping',
+                        extra={'path': src_path}
+                    )
                 return
                 
-            self._process_file_event(event, mapping, is_creation=True)
+            self._process_file_event(Path(src_path), mapping, is_creation)
             
         except Exception as e:
             self.logger.error(
-                'Error handling creation event',
+                'Error handling creation event' if is_creation
+                else 'Error handling modification event',
                 extra={
-                    'path': event.src_path,
+                    'path': src_path,
                     'error': str(e)
                 }
             )
-            raise
-        finally:
-            self._remove_from_processing(event.src_path)
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """Dispatch only the events this handler acts on.
+        
+        Inotify also reports close, delete and parent-directory
+        modification events for every write, and editors churn through
+        hidden and temporary files; drop them here before watchdog's
+        generic dispatch or the debounce timers do any work. Moved files
+        are filtered by their destination.
+        
+        Args:
+            event: File system event
+        """
+        if event.is_directory:
+            if (self._on_directory_event is not None
+                    and event.event_type in _DIRECTORY_EVENT_TYPES):
+                self._on_directory_event(event)
+            return
+        if event.event_type not in _HANDLED_EVENT_TYPES:
+            return
+        if event.event_type == EVENT_TYPE_MOVED:
+            src_path = event.dest_path
+        else:
+            src_path = event.src_path
+        if (src_path.endswith(_IGNORED_SUFFIXES)
+                or os.path.basename(src_path).startswith(_IGNORED_PREFIXES)):
+            return
+        super().dispatch(event)
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle creation events.
+        
+        Args:
+            event: File system event
+        """
+        if event.is_directory:
+            return
+            
+        self._schedule(event.src_path, is_creation=True)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle modification events.
@@ -228,66 +525,189 @@ class StorageEventHandler(FileSystemEventHandler):
         if event.is_directory:
             return
             
-        if not self._add_to_processing(event.src_path):
+        self._schedule(event.src_path, is_creation=False)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle files renamed into place.
+        
+        Atomic writers (editors, rsync, most ETL tools) write a temporary
+        file and rename it over the target, which only produces a move
+        event for the target path. The sync handler decides whether the
+        result is a new table or a new version of a loaded file.
+        
+        Args:
+            event: File system event
+        """
+        if event.is_directory:
             return
-            
-        try:
-            file_path = Path(event.src_path)
-            mapping = self.storage.get_mapping_for_file(str(file_path))
-            
-            if not mapping or not mapping.enabled:
-                self.logger.debug(
-                    'Ignoring file with no mapping or disabled mapping',
-                    extra={'path': str(file_path)}
-                )
-                return
-                
-            self._process_file_event(event, mapping, is_creation=False)
-            
-        except Exception as e:
-            self.logger.error(
-                'Error handling modification event',
-                extra={
-                    'path': event.src_path,
-                    'error': str(e)
-                }
-            )
-            raise
-        finally:
-            self._remove_from_processing(event.src_path)
+        
+        with self._pending_lock:
+            self._replaced.add(event.dest_path)
+        self._schedule(event.dest_path, is_creation=False)
 
 class DirectoryWatcher:
-    """Watches a directory for changes and processes them."""
+    """Watches a directory for changes and processes them.
+    
+    The top level is watched on its own and each subdirectory recursively,
+    so top-level ignored trees such as .git or node_modules never get
+    inotify watches; ignored names deeper down are watched with the rest
+    of their subdirectory. Subdirectories created, moved or removed later
+    are watched or unwatched as they appear and disappear.
+    """
     
     def __init__(
         self,
         path: str,
         storage_client: StorageClient,
         logger: Optional[logging.Logger] = None,
-        compression_threshold_mb: float = 50.0
+        compression_threshold_mb: float = 50.0,
+        debounce_seconds: float = 0.5,
+        ignored_dirs: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+        force_polling: bool = False,
+        observer: Optional[BaseObserver] = None
     ):
         """Initialize the directory watcher.
         
         Args:
             path: Directory path to watch
-            storage_client: Keboola Storage client instance
+            storage_client: Keboola Storage client instance, shared by all
+                events for the lifetime of the handler (create it once;
+                connecting per event costs a round-trip and a TLS handshake)
             logger: Optional logger instance
             compression_threshold_mb: File size threshold for compression in MB
+            debounce_seconds: Quiet period before a burst of events on a
+                file is processed
+            ignored_dirs: Extra top-level subdirectory names to leave
+                unwatched, in addition to IGNORED_DIRS
+            max_workers: Number of files processed and uploaded
+                concurrently (defaults to CPU count)
+            force_polling: Poll the directory for changes instead of using
+                native events; network filesystems are always polled
+            observer: Observer shared with other watchers, so several
+                directories use one thread and inotify instance; the
+                caller owns and starts it, and stop() only removes this
+                watcher's watches from it
         """
         self.path = path
+        self._root = os.path.normpath(path)
+        self._ignored_dirs = IGNORED_DIRS.union(ignored_dirs or ())
+        # Subdirectory watches; a placeholder object while one is being added
+        self._subdir_watches: Dict[str, object] = {}
+        self._watch_lock = threading.Lock()
         self.event_handler = StorageEventHandler(
             storage_client,
             logger,
-            compression_threshold_mb
+            compression_threshold_mb,
+            debounce_seconds,
+            max_workers,
+            on_directory_event=self._on_directory_event
+        )
+        self._owns_observer = observer is None
+        self.observer = observer or create_observer(path, force_polling, logger)
+        self._root_watch = self.observer.schedule(
+            self.event_handler,
+            path,
+            recursive=False
         )
-        self.observer = Observer()
-        self.observer.schedule(self.event_handler, path, recursive=True)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    self._watch_subdir(entry.path)
+
+    def _watch_subdir(self, dir_path: str) -> bool:
+        """Watch a top-level subdirectory recursively unless it is ignored.
+        
+        Only the subdirectory's own name is checked against ignored_dirs;
+        watchdog watches a recursive tree as a whole.
+        
+        Returns:
+            True if a new watch was added
+        """
+        if os.path.basename(dir_path) in self._ignored_dirs:
+            return False
+        # The observer dispatches events while holding its own lock, and
+        # directory events end up here; scheduling under _watch_lock would
+        # take the two locks in the opposite order, so only reserve the
+        # entry under it
+        reservation = object()
+        with self._watch_lock:
+            if dir_path in self._subdir_watches:
+                return False
+            self._subdir_watches[dir_path] = reservation
+        try:
+            watch = self.observer.schedule(
+                self.event_handler,
+                dir_path,
+                recursive=True
+            )
+        except FileNotFoundError:
+            # Removed before the watch could be added
+            with self._watch_lock:
+                if self._subdir_watches.get(dir_path) is reservation:
+                    del self._subdir_watches[dir_path]
+            return False
+        with self._watch_lock:
+            if self._subdir_watches.get(dir_path) is reservation:
+                self._subdir_watches[dir_path] = watch
+                return True
+        # Unwatched while the watch was being added
+        self._unschedule(watch)
+        return False
+
+    def _unschedule(self, watch: ObservedWatch) -> None:
+        """Remove a watch from the observer if it is still scheduled."""
+        try:
+            self.observer.unschedule(watch)
+        except KeyError:
+            pass
+
+    def _unwatch_subdir(self, dir_path: str) -> None:
+        """Stop watching a top-level subdirectory."""
+        with self._watch_lock:
+            watch = self._subdir_watches.pop(dir_path, None)
+        if isinstance(watch, ObservedWatch):
+            self._unschedule(watch)
+
+    def _on_directory_event(self, event: FileSystemEvent) -> None:
+        """Keep subdirectory watches in sync with the top level."""
+        if os.path.dirname(os.path.normpath(event.src_path)) == self._root:
+            if event.event_type == EVENT_TYPE_CREATED:
+                self._watch_new_subdir(event.src_path)
+            else:
+                self._unwatch_subdir(event.src_path)
+        
+        dest_path = getattr(event, 'dest_path', None)
+        if (event.event_type == EVENT_TYPE_MOVED and dest_path
+                and os.path.dirname(os.path.normpath(dest_path)) == self._root):
+            self._watch_new_subdir(dest_path)
+
+    def _watch_new_subdir(self, dir_path: str) -> None:
+        """Watch a new subdirectory and pick up files already inside it."""
+        if not self._watch_subdir(dir_path):
+            return
+        # Files written before the watch existed produced no events
+        self.event_handler.scan_directory(dir_path)
 
     def start(self):
-        """Start watching the directory."""
-        self.observer.start()
+        """Start watching the directory.
+        
+        A shared observer is left for its owner to start.
+        """
+        if self._owns_observer:
+            self.observer.start()
 
     def stop(self):
         """Stop watching the directory."""
-        self.observer.stop()
-        self.observer.join()
+        if self._owns_observer:
+            self.observer.stop()
+            self.observer.join()
+        else:
+            # Leave a shared observer running for the other watchers
+            with self._watch_lock:
+                watches = [self._root_watch, *self._subdir_watches.values()]
+                self._subdir_watches.clear()
+            for watch in watches:
+                if isinstance(watch, ObservedWatch):
+                    self._unschedule(watch)
+        self.event_handler.shutdown()
@@ -13,9 +13,4 @@ setup(
             'keboola-storage-daemon=daemon.main:main',  # Adjust the callable as needed
         ]
     },
-    # Optionally include data files if they are required by your package
-    data_files=[
-        ('.', ['.env.template']), 
-        ('docs', ['docs/production_design.md']),
-    ],
 ) 
\ No newline at end of file
@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 """Script to generate test data for manual testing of the Keboola Storage Daemon."""
 
-import csv
+import argparse
+import codecs
 import gzip
 import os
 import random
 import string
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
+
+# Characters and length of generated random cell values
+ALPHANUMERIC = string.ascii_letters + string.digits
+CELL_LENGTH = 10
+
+# Rows generated and written at once by create_large_file
+LARGE_FILE_BATCH_ROWS = 10000
 
 def create_directory_structure(base_dir: str) -> None:
     """Create the test directory structure."""
@@ -26,22 +35,33 @@ def create_directory_structure(base_dir: str) -> None:
         print(f"Created directory: {path}")
 
 def generate_row_data(num_columns: int) -> List[str]:
-    """Generate random data for a CSV row."""
+    """Generate random data for a CSV row.
+    
+    Draws the characters for all cells in one random.choices call and
+    slices them into cells, instead of one call and join per cell.
+    """
+    chars = ''.join(random.choices(ALPHANUMERIC, k=CELL_LENGTH * num_columns))
     return [
-        ''.join(random.choices(string.ascii_letters + string.digits, k=10))
-        for _ in range(num_columns)
+        chars[i:i + CELL_LENGTH]
+        for i in range(0, len(chars), CELL_LENGTH)
     ]
 
 def create_basic_csv(base_dir: str) -> None:
-    """Create basic CSV files with different structures."""
+    """Create basic CSV files with different structures.
+    
+    The rows are plain ASCII that never needs quoting, so they are
+    formatted directly as bytes and written in one call rather than
+    through csv.writer.
+    """
     output_dir = Path(base_dir) / 'basic_csv'
     
     # Simple CSV with header
-    with open(output_dir / 'simple.csv', 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['id', 'name', 'value'])
-        for i in range(100):
-            writer.writerow([i, f'name_{i}', random.randint(1, 1000)])
+    with open(output_dir / 'simple.csv', 'wb') as f:
+        f.write(b''.join([
+            b'id,name,value\r\n',
+            *(b'%d,name_%d,%d\r\n' % (i, i, random.randint(1, 1000))
+              for i in range(100))
+        ]))
     
     print("Created basic CSV files")
 
@@ -59,32 +79,30 @@ def create_delimiter_variations(base_dir: str) -> None:
         'tab.csv': '\t'
     }
     
+    # Alphanumeric cells never need quoting, so each variant is just the
+    # rows joined with its delimiter
     for filename, delimiter in delimiters.items():
-        with open(output_dir / filename, 'w', newline='') as f:
-            writer = csv.writer(f, delimiter=delimiter)
-            writer.writerows(data)
+        (output_dir / filename).write_bytes(''.join(
+            delimiter.join(row) + '\r\n' for row in data
+        ).encode('ascii'))
     
     print("Created delimiter variation files")
 
 def create_encoding_variations(base_dir: str) -> None:
     """Create CSV files with different encodings."""
     output_dir = Path(base_dir) / 'encodings'
-    data = [
-        ['id', 'name', 'description'],
-        ['1', 'José', 'áéíóú'],
-        ['2', '中文', '测试'],
-        ['3', 'Русский', 'тест']
-    ]
+    payload = (
+        'id,name,description\r\n'
+        '1,José,áéíóú\r\n'
+        '2,中文,测试\r\n'
+        '3,Русский,тест\r\n'
+    ).encode('utf-8')
     
     # UTF-8
-    with open(output_dir / 'utf8.csv', 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerows(data)
+    (output_dir / 'utf8.csv').write_bytes(payload)
     
     # UTF-8 with BOM
-    with open(output_dir / 'utf8_bom.csv', 'w', newline='', encoding='utf-8-sig') as f:
-        writer = csv.writer(f)
-        writer.writerows(data)
+    (output_dir / 'utf8_bom.csv').write_bytes(codecs.BOM_UTF8 + payload)
     
     print("Created encoding variation files")
 
@@ -92,14 +110,22 @@ def create_large_file(base_dir: str) -> None:
     """Create a large CSV file (>50MB)."""
     output_dir = Path(base_dir) / 'large_files'
     
-    # Create a ~60MB file
-    with open(output_dir / 'large.csv', 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['id'] + [f'col_{i}' for i in range(20)])
+    num_rows = 200000  # This should generate >50MB
+    num_columns = 20
+    
+    # Random alphanumeric cells never need quoting, so rows are joined
+    # directly and written a batch at a time instead of via csv.writer
+    with open(output_dir / 'large.csv', 'wb') as f:
+        header = ['id'] + [f'col_{i}' for i in range(num_columns)]
+        f.write((','.join(header) + '\r\n').encode('ascii'))
         
-        for i in range(200000):  # This should generate >50MB
-            row = [i] + generate_row_data(20)
-            writer.writerow(row)
+        for start in range(0, num_rows, LARGE_FILE_BATCH_ROWS):
+            count = min(LARGE_FILE_BATCH_ROWS, num_rows - start)
+            cells = generate_row_data(num_columns * count)
+            f.write(''.join(
+                f"{start + r},{','.join(cells[r * num_columns:(r + 1) * num_columns])}\r\n"
+                for r in range(count)
+            ).encode('ascii'))
     
     print("Created large CSV file")
 
@@ -108,15 +134,17 @@ def create_malformed_files(base_dir: str) -> None:
     output_dir = Path(base_dir) / 'malformed'
     
     # Missing columns
-    with open(output_dir / 'missing_columns.csv', 'w', newline='') as f:
-        f.write('header1,header2,header3\n')
-        f.write('value1,value2\n')  # Missing one value
-        f.write('value1,value2,value3,value4\n')  # Extra value
+    (output_dir / 'missing_columns.csv').write_bytes(
+        b'header1,header2,header3\n'
+        b'value1,value2\n'  # Missing one value
+        b'value1,value2,value3,value4\n'  # Extra value
+    )
     
     # Invalid quotes
-    with open(output_dir / 'invalid_quotes.csv', 'w', newline='') as f:
-        f.write('header1,header2,header3\n')
-        f.write('value1,"unclosed quote,value3\n')
+    (output_dir / 'invalid_quotes.csv').write_bytes(
+        b'header1,header2,header3\n'
+        b'value1,"unclosed quote,value3\n'
+    )
     
     # Empty file
     Path(output_dir / 'empty.csv').touch()
@@ -127,17 +155,44 @@ def create_concurrent_test_files(base_dir: str) -> None:
     """Create files for testing concurrent operations."""
     output_dir = Path(base_dir) / 'concurrent'
     
+    # The id and name columns are the same in every file; only the values
+    # differ, and they are drawn in one call per file
+    prefixes = [b'%d,name_%d,' % (j, j) for j in range(1000)]
     for i in range(5):
-        with open(output_dir / f'concurrent_{i}.csv', 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['id', 'name', 'value'])
-            for j in range(1000):
-                writer.writerow([j, f'name_{j}', random.randint(1, 1000)])
+        values = random.choices(range(1, 1001), k=len(prefixes))
+        with open(output_dir / f'concurrent_{i}.csv', 'wb') as f:
+            f.write(b''.join([
+                b'id,name,value\r\n',
+                *(b'%b%d\r\n' % (p, v) for p, v in zip(prefixes, values))
+            ]))
     
     print("Created concurrent test files")
 
+def run_generator(
+    generator: Callable[[Path], None],
+    base_dir: Path,
+    seed: Optional[int]
+) -> None:
+    """Run a generator with its own RNG seed.
+    
+    The seed is derived from the base seed and the generator's name, so a
+    given seed reproduces every file regardless of which worker runs it.
+    Without a seed the RNG is seeded from the OS.
+    """
+    random.seed(None if seed is None else f'{seed}:{generator.__name__}')
+    generator(base_dir)
+
 def main():
     """Main function to generate all test data."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed for reproducible test data (default: random)'
+    )
+    args = parser.parse_args()
+    
     base_dir = Path('test_data')
     
     # Create base directory
@@ -146,13 +201,25 @@ def main():
     # Create directory structure
     create_directory_structure(base_dir)
     
-    # Generate test files
-    create_basic_csv(base_dir)
-    create_delimiter_variations(base_dir)
-    create_encoding_variations(base_dir)
-    create_large_file(base_dir)
-    create_malformed_files(base_dir)
-    create_concurrent_test_files(base_dir)
+    # Generate test files; the generators write to separate directories,
+    # so they run in parallel, each seeding its own RNG
+    generators = [
+        create_large_file,
+        create_basic_csv,
+        create_delimiter_variations,
+        create_encoding_variations,
+        create_malformed_files,
+        create_concurrent_test_files
+    ]
+    with ProcessPoolExecutor(
+        max_workers=min(len(generators), os.cpu_count() or 1)
+    ) as pool:
+        futures = [
+            pool.submit(run_generator, g, base_dir, args.seed)
+            for g in generators
+        ]
+        for future in futures:
+            future.result()
     
     print("\nTest data generation complete!")
     print(f"Test files are located in: {base_dir.absolute()}")